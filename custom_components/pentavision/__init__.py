@@ -4,14 +4,25 @@ from __future__ import annotations
 import logging
 from datetime import timedelta
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import aiohttp
 
-from .const import DOMAIN, CONF_HOST, CONF_PORT, CONF_API_KEY
-from .coordinator import PentaVisionCoordinator
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_PORT,
+    CONF_API_KEY,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    KEEPALIVE_TIMEOUT,
+)
+from .coordinator import PentaVisionStateCoordinator
 from .api import PentaVisionAPI
+from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,23 +39,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     port = entry.data[CONF_PORT]
     api_key = entry.data[CONF_API_KEY]
 
-    session = async_get_clientsession(hass)
+    # Dedicated session so connections to the server stay alive between polls
+    # and snapshots for several cameras can run in parallel
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=CONNECTION_LIMIT,
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+    )
     api = PentaVisionAPI(host, port, api_key, session)
 
-    # Perform handshake to get session token
-    if not await api.authenticate():
-        _LOGGER.error("Failed to authenticate with PentaVision server")
-        return False
-
-    coordinator = PentaVisionCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data[DOMAIN][entry.entry_id] = {
-        "api": api,
-        "coordinator": coordinator,
-    }
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Entries are not unloaded on shutdown, so close the session explicitly
+    async def _async_close_session(event: Event) -> None:
+        """Close the aiohttp session when Home Assistant stops."""
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
+    try:
+        # Perform handshake to get session token
+        if not await api.authenticate():
+            _LOGGER.error("Failed to authenticate with PentaVision server")
+            await session.close()
+            return False
+
+        coordinator = PentaVisionStateCoordinator(hass, entry, api)
+        await coordinator.async_config_entry_first_refresh()
+
+        hass.data[DOMAIN][entry.entry_id] = {
+            "api": api,
+            "coordinator": coordinator,
+            "session": session,
+        }
+
+        # Server status moved from the sensor to the binary_sensor platform
+        ent_reg = er.async_get(hass)
+        if old_entity_id := ent_reg.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{entry.entry_id}_server_online"
+        ):
+            ent_reg.async_remove(old_entity_id)
+
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await session.close()
+        raise
+
+    async_setup_services(hass)
+
+    # Entities are created per camera, so reload when cameras are added or
+    # removed. The state poll already carries the full camera list.
+    camera_ids = set(coordinator.cameras_by_id)
+
+    @callback
+    def _async_cameras_updated() -> None:
+        """Reload the entry when cameras are added or removed."""
+        if coordinator.last_update_success and (
+            coordinator.cameras_by_id.keys() != camera_ids
+        ):
+            hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_cameras_updated))
 
     return True
 
@@ -56,6 +114,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Revoke session on unload
         api: PentaVisionAPI = data["api"]
         await api.revoke_session()
+        session: aiohttp.ClientSession = data["session"]
+        await session.close()
+        async_unload_services(hass)
 
     return unload_ok
 
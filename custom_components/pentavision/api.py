@@ -1,14 +1,17 @@
 """PentaVision API client for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import logging
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import (
+    API_BULK,
     API_CAMERAS,
     API_CAMERA_INFO,
     API_CAMERA_SNAPSHOT,
@@ -19,18 +22,31 @@ from .const import (
     API_PTZ,
     API_SESSION_REVOKE,
     API_STATUS,
+    ERROR_INVALID_RESPONSE,
+    ERROR_SESSION_INVALID,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Pre-encoded body for the frequently sent PTZ stop command
+_PTZ_STOP_JSON = orjson.dumps({"command": "stop"})
+
 
 class PentaVisionAPIError(Exception):
     """Exception for PentaVision API errors."""
 
-    def __init__(self, message: str, code: str | None = None):
+    def __init__(
+        self,
+        message: str,
+        code: str | None = None,
+        status: int | None = None,
+    ):
         """Initialize the exception."""
         super().__init__(message)
         self.code = code
+        self.status = status
 
 
 class PentaVisionAPI:
@@ -47,143 +63,337 @@ class PentaVisionAPI:
         self.host = host
         self.port = port
         self.api_key = api_key
+        self._api_key_bytes = api_key.encode()
+        self._api_key_hash = hashlib.sha256(self._api_key_bytes).hexdigest()
         self._session = session
         self._session_token: str | None = None
+        self._auth_lock = asyncio.Lock()
+        self._bulk_supported = True
         self._base_url = f"http://{host}:{port}"
+        self._url_cache: dict[str, dict[str, str]] = {}
+        self._cameras_cache: list[dict[str, Any]] = []
+        self._cameras_etag: str | None = None
 
     @property
     def authenticated(self) -> bool:
         """Return True if we have a valid session token."""
         return self._session_token is not None
 
-    async def authenticate(self) -> bool:
-        """Perform secure handshake to get session token."""
-        try:
-            # Step 1: Initialize handshake
-            init_response = await self._request(
-                "POST",
-                API_HANDSHAKE_INIT,
-                json={"api_key_hash": hashlib.sha256(self.api_key.encode()).hexdigest()},
-                auth=False,
-            )
+    @property
+    def session_token(self) -> str | None:
+        """Return the current session token."""
+        return self._session_token
 
-            if "error" in init_response:
-                _LOGGER.error("Handshake init failed: %s", init_response.get("error"))
+    async def authenticate(
+        self,
+        force: bool = False,
+        stale_token: str | None = None,
+    ) -> bool:
+        """Perform secure handshake to get session token.
+
+        Concurrent callers share a single handshake. Unless force is set,
+        an existing session token is kept. A forced handshake is skipped if
+        the session token no longer matches stale_token, the token that was
+        rejected, because another caller has already renewed the session.
+        """
+        if stale_token is None:
+            stale_token = self._session_token
+        async with self._auth_lock:
+            if self._session_token is not None and (
+                not force or self._session_token != stale_token
+            ):
+                # Already authenticated, or another caller renewed the session
+                return True
+
+            try:
+                await self.handshake()
+            except Exception as err:
+                _LOGGER.error("Authentication failed: %s", err)
                 return False
 
-            challenge = init_response.get("challenge")
-            nonce = init_response.get("nonce")
+        _LOGGER.info("Successfully authenticated with PentaVision server")
+        return True
 
-            if not challenge or not nonce:
-                _LOGGER.error("Invalid handshake response: missing challenge or nonce")
-                return False
+    async def handshake(self) -> None:
+        """Perform secure handshake, raising PentaVisionAPIError on failure."""
+        # Step 1: Initialize handshake
+        init_response = await self._request(
+            "POST",
+            API_HANDSHAKE_INIT,
+            json={"api_key_hash": self._api_key_hash},
+            auth=False,
+        )
 
-            # Step 2: Complete handshake with HMAC response
-            response_hmac = hmac.new(
-                self.api_key.encode(),
-                challenge.encode(),
-                hashlib.sha256,
-            ).hexdigest()
-
-            complete_response = await self._request(
-                "POST",
-                API_HANDSHAKE_COMPLETE,
-                json={
-                    "nonce": nonce,
-                    "response": response_hmac,
-                    "client_info": {
-                        "type": "home_assistant",
-                        "version": "1.0.0",
-                    },
-                },
-                headers={"X-API-Key": self.api_key},
-                auth=False,
+        if "error" in init_response:
+            raise PentaVisionAPIError(
+                f"Handshake init failed: {init_response['error']}",
+                init_response.get("code"),
             )
 
-            if "error" in complete_response:
-                _LOGGER.error("Handshake complete failed: %s", complete_response.get("error"))
-                return False
+        challenge = init_response.get("challenge")
+        nonce = init_response.get("nonce")
 
-            self._session_token = complete_response.get("session_token")
-            if not self._session_token:
-                _LOGGER.error("No session token in handshake response")
-                return False
+        if not challenge or not nonce:
+            raise PentaVisionAPIError(
+                "Invalid handshake response: missing challenge or nonce",
+                ERROR_INVALID_RESPONSE,
+            )
 
-            _LOGGER.info("Successfully authenticated with PentaVision server")
-            return True
+        # Step 2: Complete handshake with HMAC response
+        response_hmac = hmac.digest(
+            self._api_key_bytes,
+            challenge.encode(),
+            "sha256",
+        ).hex()
 
-        except Exception as err:
-            _LOGGER.error("Authentication failed: %s", err)
-            return False
+        complete_response = await self._request(
+            "POST",
+            API_HANDSHAKE_COMPLETE,
+            json={
+                "nonce": nonce,
+                "response": response_hmac,
+                "client_info": {
+                    "type": "home_assistant",
+                    "version": "1.0.0",
+                },
+            },
+            headers={"X-API-Key": self.api_key},
+            auth=False,
+        )
+
+        if "error" in complete_response:
+            raise PentaVisionAPIError(
+                f"Handshake complete failed: {complete_response['error']}",
+                complete_response.get("code"),
+            )
+
+        session_token = complete_response.get("session_token")
+        if not session_token:
+            raise PentaVisionAPIError(
+                "No session token in handshake response",
+                ERROR_INVALID_RESPONSE,
+            )
+
+        self._session_token = session_token
 
     async def revoke_session(self) -> bool:
         """Revoke the current session."""
         if not self._session_token:
             return True
 
+        # Sent without the re-authentication retry: a rejected token is
+        # already invalid, and a new handshake would only be revoked again
         try:
-            await self._request("POST", API_SESSION_REVOKE)
-            self._session_token = None
-            return True
+            await self._send("POST", API_SESSION_REVOKE, token=self._session_token)
+        except PentaVisionAPIError as err:
+            if err.status != 401 and err.code != ERROR_SESSION_INVALID:
+                _LOGGER.warning("Failed to revoke session: %s", err)
+                return False
         except Exception as err:
             _LOGGER.warning("Failed to revoke session: %s", err)
             return False
 
+        self._session_token = None
+        return True
+
     async def _request(
         self,
         method: str,
         endpoint: str,
         *,
         json: dict | None = None,
+        data: bytes | None = None,
         headers: dict | None = None,
         auth: bool = True,
     ) -> dict[str, Any]:
-        """Make an API request."""
+        """Make an API request, re-authenticating once if rejected."""
+        response, _ = await self._request_with_etag(
+            method, endpoint, json=json, data=data, headers=headers, auth=auth
+        )
+        return response
+
+    async def _request_with_etag(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        json: dict | None = None,
+        data: bytes | None = None,
+        headers: dict | None = None,
+        auth: bool = True,
+        etag: str | None = None,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """Make an API request and return the response data with its ETag.
+
+        The body is either a dict passed as json, or an already encoded JSON
+        document passed as data. If etag is given it is sent as If-None-Match,
+        and the data is None when the server answers 304 Not Modified.
+        """
+        token = self._session_token if auth else None
+        try:
+            return await self._send(
+                method,
+                endpoint,
+                json=json,
+                data=data,
+                headers=headers,
+                token=token,
+                etag=etag,
+            )
+        except PentaVisionAPIError as err:
+            if not auth or (
+                err.status != 401 and err.code != ERROR_SESSION_INVALID
+            ):
+                raise
+            _LOGGER.info("Session rejected, re-authenticating...")
+            if not await self.authenticate(force=True, stale_token=token):
+                raise
+
+        return await self._send(
+            method,
+            endpoint,
+            json=json,
+            data=data,
+            headers=headers,
+            token=self._session_token,
+            etag=etag,
+        )
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        json: dict | None = None,
+        data: bytes | None = None,
+        headers: dict | None = None,
+        token: str | None = None,
+        etag: str | None = None,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """Send a single API request, authenticated with token if given."""
         url = f"{self._base_url}{endpoint}"
-        request_headers = headers or {}
+        request_headers = dict(headers) if headers else {}
+
+        if token:
+            request_headers["X-Session-Token"] = token
 
-        if auth and self._session_token:
-            request_headers["X-Session-Token"] = self._session_token
+        if etag:
+            request_headers["If-None-Match"] = etag
+
+        body = data
+        if json is not None:
+            body = orjson.dumps(json)
+        if body is not None:
+            request_headers["Content-Type"] = "application/json"
 
         try:
             async with self._session.request(
                 method,
                 url,
-                json=json,
+                data=body,
                 headers=request_headers,
-                timeout=aiohttp.ClientTimeout(total=30),
+                timeout=_REQUEST_TIMEOUT,
             ) as response:
-                data = await response.json()
-
                 if response.status >= 400:
+                    try:
+                        error = orjson.loads(await response.read())
+                    except ValueError:
+                        error = None
+                    if not isinstance(error, dict):
+                        error = {}
                     raise PentaVisionAPIError(
-                        data.get("error", "Unknown error"),
-                        data.get("code"),
+                        error.get("error", "Unknown error"),
+                        error.get("code"),
+                        response.status,
                     )
 
-                return data
+                response_etag = response.headers.get("ETag")
+                if response.status == 304:
+                    return None, response_etag or etag
+
+                try:
+                    result = orjson.loads(await response.read())
+                except ValueError as err:
+                    raise PentaVisionAPIError(
+                        f"Invalid JSON response: {err}",
+                        ERROR_INVALID_RESPONSE,
+                        response.status,
+                    ) from err
+                if not isinstance(result, dict):
+                    raise PentaVisionAPIError(
+                        "Invalid response: expected a JSON object",
+                        ERROR_INVALID_RESPONSE,
+                        response.status,
+                    )
+
+                return result, response_etag
 
         except aiohttp.ClientError as err:
             raise PentaVisionAPIError(f"Connection error: {err}") from err
 
+    def _camera_urls(self, camera_id: str) -> dict[str, str]:
+        """Return the endpoints and URLs for a camera, built on first use."""
+        urls = self._url_cache.get(camera_id)
+        if urls is None:
+            urls = self._url_cache[camera_id] = {
+                "info": API_CAMERA_INFO.format(camera_id=camera_id),
+                "ptz": API_PTZ.format(camera_id=camera_id),
+                "snapshot": self._base_url
+                + API_CAMERA_SNAPSHOT.format(camera_id=camera_id),
+                "mjpeg": self._base_url + API_MJPEG_STREAM.format(camera_id=camera_id),
+                "hls": self._base_url + API_HLS_PLAYLIST.format(camera_id=camera_id),
+            }
+        return urls
+
     async def get_status(self) -> dict[str, Any]:
         """Get server status."""
         return await self._request("GET", API_STATUS)
 
     async def get_cameras(self) -> list[dict[str, Any]]:
         """Get list of cameras."""
-        response = await self._request("GET", API_CAMERAS)
-        return response.get("cameras", [])
+        response, etag = await self._request_with_etag(
+            "GET", API_CAMERAS, etag=self._cameras_etag
+        )
+        if response is None:
+            # Not modified since the last fetch
+            return self._cameras_cache
+
+        self._cameras_etag = etag
+        self._cameras_cache = response.get("cameras", [])
+        return self._cameras_cache
+
+    async def get_bulk(self) -> dict[str, Any]:
+        """Get server status and cameras list in a single request.
+
+        Falls back to separate status and cameras requests on servers
+        that do not provide the bulk endpoint.
+        """
+        if self._bulk_supported:
+            try:
+                response = await self._request("GET", API_BULK)
+            except PentaVisionAPIError as err:
+                if err.status != 404:
+                    raise
+                _LOGGER.debug("Bulk endpoint not available, using separate requests")
+                self._bulk_supported = False
+            else:
+                return {
+                    "status": response.get("status", {}),
+                    "cameras": response.get("cameras", []),
+                }
+
+        return {
+            "status": await self.get_status(),
+            "cameras": await self.get_cameras(),
+        }
 
     async def get_camera_info(self, camera_id: str) -> dict[str, Any]:
         """Get camera information."""
-        endpoint = API_CAMERA_INFO.format(camera_id=camera_id)
-        return await self._request("GET", endpoint)
+        return await self._request("GET", self._camera_urls(camera_id)["info"])
 
     async def get_snapshot(self, camera_id: str) -> bytes:
         """Get camera snapshot as bytes."""
-        endpoint = API_CAMERA_SNAPSHOT.format(camera_id=camera_id)
-        url = f"{self._base_url}{endpoint}"
+        url = self._camera_urls(camera_id)["snapshot"]
         headers = {}
 
         if self._session_token:
@@ -192,7 +402,7 @@ class PentaVisionAPI:
         async with self._session.get(
             url,
             headers=headers,
-            timeout=aiohttp.ClientTimeout(total=30),
+            timeout=_REQUEST_TIMEOUT,
         ) as response:
             if response.status >= 400:
                 raise PentaVisionAPIError(f"Snapshot failed: {response.status}")
@@ -200,17 +410,17 @@ class PentaVisionAPI:
 
     def get_mjpeg_url(self, camera_id: str) -> str:
         """Get MJPEG stream URL."""
-        endpoint = API_MJPEG_STREAM.format(camera_id=camera_id)
+        url = self._camera_urls(camera_id)["mjpeg"]
         if self._session_token:
-            return f"{self._base_url}{endpoint}?session_token={self._session_token}"
-        return f"{self._base_url}{endpoint}?api_key={self.api_key}"
+            return f"{url}?session_token={self._session_token}"
+        return f"{url}?api_key={self.api_key}"
 
     def get_hls_url(self, camera_id: str) -> str:
         """Get HLS stream URL."""
-        endpoint = API_HLS_PLAYLIST.format(camera_id=camera_id)
+        url = self._camera_urls(camera_id)["hls"]
         if self._session_token:
-            return f"{self._base_url}{endpoint}?session_token={self._session_token}"
-        return f"{self._base_url}{endpoint}?api_key={self.api_key}"
+            return f"{url}?session_token={self._session_token}"
+        return f"{url}?api_key={self.api_key}"
 
     async def ptz_move(
         self,
@@ -219,7 +429,7 @@ class PentaVisionAPI:
         speed: int = 50,
     ) -> dict[str, Any]:
         """Send PTZ move command."""
-        endpoint = API_PTZ.format(camera_id=camera_id)
+        endpoint = self._camera_urls(camera_id)["ptz"]
         return await self._request(
             "POST",
             endpoint,
@@ -230,9 +440,36 @@ class PentaVisionAPI:
             },
         )
 
+    async def ptz_move_many(
+        self,
+        targets: list[tuple[str, str, int]],
+    ) -> list[dict[str, Any]]:
+        """Send PTZ move commands to several cameras concurrently.
+
+        All moves are awaited; the first failure is then raised naming the
+        camera it belongs to.
+        """
+        results = await asyncio.gather(
+            *(
+                self.ptz_move(camera_id, direction, speed)
+                for camera_id, direction, speed in targets
+            ),
+            return_exceptions=True,
+        )
+        for (camera_id, _, _), result in zip(targets, results):
+            if isinstance(result, PentaVisionAPIError):
+                raise PentaVisionAPIError(
+                    f"PTZ move failed for camera {camera_id}: {result}",
+                    result.code,
+                    result.status,
+                ) from result
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
     async def ptz_preset(self, camera_id: str, preset: int) -> dict[str, Any]:
         """Go to PTZ preset."""
-        endpoint = API_PTZ.format(camera_id=camera_id)
+        endpoint = self._camera_urls(camera_id)["ptz"]
         return await self._request(
             "POST",
             endpoint,
@@ -244,9 +481,5 @@ class PentaVisionAPI:
 
     async def ptz_stop(self, camera_id: str) -> dict[str, Any]:
         """Stop PTZ movement."""
-        endpoint = API_PTZ.format(camera_id=camera_id)
-        return await self._request(
-            "POST",
-            endpoint,
-            json={"command": "stop"},
-        )
+        endpoint = self._camera_urls(camera_id)["ptz"]
+        return await self._request("POST", endpoint, data=_PTZ_STOP_JSON)
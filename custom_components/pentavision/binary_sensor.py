@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -10,15 +13,21 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, ATTR_CAMERA_ID
-from .coordinator import PentaVisionCoordinator
+from .coordinator import PentaVisionStateCoordinator
+from .entity import PentaVisionStateEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only empty mapping, used instead of allocating a new dict
+_EMPTY: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Server status attributes and their defaults
+_STATUS_KEYS: Final = ("requests_total", "requests_authenticated", "active_streams", "uptime")
+_STATUS_DEFAULTS: Final = (0, 0, 0, None)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,39 +36,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up PentaVision binary sensors from a config entry."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: PentaVisionCoordinator = data["coordinator"]
-
-    sensors = []
-
-    # Create motion detection sensors for each camera
-    for camera_data in coordinator.cameras:
-        camera_id = camera_data.get("id") or camera_data.get("camera_id")
-        camera_name = camera_data.get("name", f"Camera {camera_id}")
-
-        # Motion detection sensor
-        sensors.append(
-            PentaVisionMotionSensor(
-                coordinator,
-                entry,
-                camera_id,
-                camera_name,
-            )
-        )
-
-        # Camera online sensor
-        sensors.append(
-            PentaVisionCameraOnlineSensor(
-                coordinator,
-                entry,
-                camera_id,
-                camera_name,
-            )
-        )
+    coordinator: PentaVisionStateCoordinator = data["coordinator"]
+
+    sensors = [PentaVisionServerOnlineSensor(coordinator, entry)]
+
+    # Create motion detection and online sensors for each camera
+    for camera_id in coordinator.cameras_by_id:
+        sensors.append(PentaVisionMotionSensor(coordinator, camera_id))
+        sensors.append(PentaVisionCameraOnlineSensor(coordinator, camera_id))
 
     async_add_entities(sensors)
 
 
-class PentaVisionMotionSensor(CoordinatorEntity[PentaVisionCoordinator], BinarySensorEntity):
+class PentaVisionMotionSensor(PentaVisionStateEntity, BinarySensorEntity):
     """Binary sensor for camera motion detection."""
 
     _attr_has_entity_name = True
@@ -67,37 +56,30 @@ class PentaVisionMotionSensor(CoordinatorEntity[PentaVisionCoordinator], BinaryS
 
     def __init__(
         self,
-        coordinator: PentaVisionCoordinator,
-        entry: ConfigEntry,
+        coordinator: PentaVisionStateCoordinator,
         camera_id: str,
-        camera_name: str,
     ) -> None:
         """Initialize the motion sensor."""
         super().__init__(coordinator)
 
         self._camera_id = camera_id
-        self._attr_unique_id = f"{entry.entry_id}_{camera_id}_motion"
-        self._attr_name = f"{camera_name} Motion"
+        self._attr_unique_id = coordinator.unique_ids_for(camera_id)["motion"]
+        self._attr_name = coordinator.entity_names_for(camera_id)["motion"]
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{entry.entry_id}_{camera_id}")},
-            name=camera_name,
-            manufacturer="PentaVision",
-            via_device=(DOMAIN, entry.entry_id),
-        )
+        self._attr_device_info = coordinator.device_info_for(camera_id)
+
+    def _written_state(self) -> tuple[Any, ...]:
+        """Return the values compared to decide whether to write state."""
+        return (self.available, self.is_on)
 
     @property
     def is_on(self) -> bool | None:
         """Return True if motion is detected."""
-        if self.coordinator.data is None:
+        camera = self.coordinator.cameras_by_id.get(self._camera_id)
+        if camera is None:
             return None
 
-        for camera in self.coordinator.data.get("cameras", []):
-            cam_id = camera.get("id") or camera.get("camera_id")
-            if cam_id == self._camera_id:
-                return camera.get("motion_detected", False)
-
-        return None
+        return camera.get("motion_detected", False)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -107,7 +89,7 @@ class PentaVisionMotionSensor(CoordinatorEntity[PentaVisionCoordinator], BinaryS
         }
 
 
-class PentaVisionCameraOnlineSensor(CoordinatorEntity[PentaVisionCoordinator], BinarySensorEntity):
+class PentaVisionCameraOnlineSensor(PentaVisionStateEntity, BinarySensorEntity):
     """Binary sensor for camera online status."""
 
     _attr_has_entity_name = True
@@ -115,37 +97,30 @@ class PentaVisionCameraOnlineSensor(CoordinatorEntity[PentaVisionCoordinator], B
 
     def __init__(
         self,
-        coordinator: PentaVisionCoordinator,
-        entry: ConfigEntry,
+        coordinator: PentaVisionStateCoordinator,
         camera_id: str,
-        camera_name: str,
     ) -> None:
         """Initialize the online sensor."""
         super().__init__(coordinator)
 
         self._camera_id = camera_id
-        self._attr_unique_id = f"{entry.entry_id}_{camera_id}_online"
-        self._attr_name = f"{camera_name} Online"
+        self._attr_unique_id = coordinator.unique_ids_for(camera_id)["online"]
+        self._attr_name = coordinator.entity_names_for(camera_id)["online"]
+
+        self._attr_device_info = coordinator.device_info_for(camera_id)
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{entry.entry_id}_{camera_id}")},
-            name=camera_name,
-            manufacturer="PentaVision",
-            via_device=(DOMAIN, entry.entry_id),
-        )
+    def _written_state(self) -> tuple[Any, ...]:
+        """Return the values compared to decide whether to write state."""
+        return (self.available, self.is_on)
 
     @property
     def is_on(self) -> bool | None:
         """Return True if camera is online."""
-        if self.coordinator.data is None:
+        camera = self.coordinator.cameras_by_id.get(self._camera_id)
+        if camera is None:
             return None
 
-        for camera in self.coordinator.data.get("cameras", []):
-            cam_id = camera.get("id") or camera.get("camera_id")
-            if cam_id == self._camera_id:
-                return camera.get("online", True)
-
-        return None
+        return camera.get("online", True)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -153,3 +128,59 @@ class PentaVisionCameraOnlineSensor(CoordinatorEntity[PentaVisionCoordinator], B
         return {
             ATTR_CAMERA_ID: self._camera_id,
         }
+
+
+class PentaVisionServerOnlineSensor(PentaVisionStateEntity, BinarySensorEntity):
+    """Binary sensor for PentaVision server connectivity."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_name = "Server Status"
+
+    def __init__(
+        self,
+        coordinator: PentaVisionStateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the server sensor."""
+        super().__init__(coordinator)
+
+        self._attr_unique_id = sys.intern(f"{entry.entry_id}_server_online")
+        self._attr_device_info = coordinator.server_device_info
+
+        # Attributes are rebuilt only when the coordinator publishes new data
+        self._attrs_source: dict[str, Any] | None = None
+        self._attrs_cache: Mapping[str, Any] = _EMPTY
+
+    def _written_state(self) -> tuple[Any, ...]:
+        """Return the values compared to decide whether to write state."""
+        return (self.is_on, self.extra_state_attributes)
+
+    @property
+    def available(self) -> bool:
+        """Return True, the server being unreachable is reported as off."""
+        return True
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the last poll of the server succeeded."""
+        return self.coordinator.last_update_success
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Return extra state attributes."""
+        data = self.coordinator.data
+        if data is None:
+            return _EMPTY
+
+        if data is not self._attrs_source:
+            status = data.get("status") or _EMPTY
+            self._attrs_source = data
+            self._attrs_cache = MappingProxyType(
+                {
+                    key: status.get(key, default)
+                    for key, default in zip(_STATUS_KEYS, _STATUS_DEFAULTS)
+                }
+            )
+
+        return self._attrs_cache
@@ -7,12 +7,11 @@ from typing import Any
 from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, ATTR_CAMERA_ID, ATTR_PTZ_CAPABLE
-from .coordinator import PentaVisionCoordinator
+from .coordinator import PentaVisionStateCoordinator
 from .api import PentaVisionAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,7 +24,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up PentaVision cameras from a config entry."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: PentaVisionCoordinator = data["coordinator"]
+    coordinator: PentaVisionStateCoordinator = data["coordinator"]
     api: PentaVisionAPI = data["api"]
 
     cameras = []
@@ -34,7 +33,6 @@ async def async_setup_entry(
             PentaVisionCamera(
                 coordinator,
                 api,
-                entry,
                 camera_data,
             )
         )
@@ -42,16 +40,16 @@ async def async_setup_entry(
     async_add_entities(cameras)
 
 
-class PentaVisionCamera(CoordinatorEntity[PentaVisionCoordinator], Camera):
+class PentaVisionCamera(CoordinatorEntity[PentaVisionStateCoordinator], Camera):
     """Representation of a PentaVision camera."""
 
     _attr_has_entity_name = True
+    _attr_frontend_stream_type = "hls"
 
     def __init__(
         self,
-        coordinator: PentaVisionCoordinator,
+        coordinator: PentaVisionStateCoordinator,
         api: PentaVisionAPI,
-        entry: ConfigEntry,
         camera_data: dict[str, Any],
     ) -> None:
         """Initialize the camera."""
@@ -62,9 +60,17 @@ class PentaVisionCamera(CoordinatorEntity[PentaVisionCoordinator], Camera):
         self._camera_id = camera_data.get("id") or camera_data.get("camera_id")
         self._camera_data = camera_data
 
+        # Cached attributes and stream URL, rebuilt when the camera data
+        # or the session token changes
+        self._attrs: dict[str, Any] = {}
+        self._attrs_camera: dict[str, Any] | None = None
+        self._attrs_token: str | None = None
+        self._hls_url: str | None = None
+        self._hls_token: str | None = None
+
         # Entity attributes
-        self._attr_unique_id = f"{entry.entry_id}_{self._camera_id}"
-        self._attr_name = camera_data.get("name", f"Camera {self._camera_id}")
+        self._attr_unique_id = coordinator.unique_ids_for(self._camera_id)["camera"]
+        self._attr_name = coordinator.entity_names_for(self._camera_id)["camera"]
 
         # Camera features
         features = CameraEntityFeature.STREAM
@@ -73,40 +79,44 @@ class PentaVisionCamera(CoordinatorEntity[PentaVisionCoordinator], Camera):
         self._attr_supported_features = features
 
         # Device info
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{entry.entry_id}_{self._camera_id}")},
-            name=self._attr_name,
-            manufacturer="PentaVision",
-            model=camera_data.get("model", "IP Camera"),
-            sw_version=camera_data.get("firmware", "Unknown"),
-            via_device=(DOMAIN, entry.entry_id),
-        )
+        self._attr_device_info = coordinator.device_info_for(self._camera_id)
+
+    @property
+    def _camera(self) -> dict[str, Any]:
+        """Return the latest data for this camera."""
+        return self.coordinator.cameras_by_id.get(self._camera_id, self._camera_data)
 
     @property
     def is_streaming(self) -> bool:
         """Return True if the camera is streaming."""
-        return self._camera_data.get("streaming", True)
+        return self._camera.get("streaming", True)
 
     @property
     def is_recording(self) -> bool:
         """Return True if the camera is recording."""
-        return self._camera_data.get("recording", False)
+        return self._camera.get("recording", False)
 
     @property
     def motion_detection_enabled(self) -> bool:
         """Return True if motion detection is enabled."""
-        return self._camera_data.get("motion_detection", False)
+        return self._camera.get("motion_detection", False)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        return {
-            ATTR_CAMERA_ID: self._camera_id,
-            ATTR_PTZ_CAPABLE: self._camera_data.get("ptz_capable", False),
-            "recording": self.is_recording,
-            "motion_detection": self.motion_detection_enabled,
-            "stream_url": self._api.get_mjpeg_url(self._camera_id),
-        }
+        camera = self._camera
+        token = self._api.session_token
+        if camera is not self._attrs_camera or token != self._attrs_token:
+            self._attrs_camera = camera
+            self._attrs_token = token
+            self._attrs = {
+                ATTR_CAMERA_ID: self._camera_id,
+                ATTR_PTZ_CAPABLE: camera.get("ptz_capable", False),
+                "recording": camera.get("recording", False),
+                "motion_detection": camera.get("motion_detection", False),
+                "stream_url": self._api.get_mjpeg_url(self._camera_id),
+            }
+        return self._attrs
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
@@ -120,12 +130,11 @@ class PentaVisionCamera(CoordinatorEntity[PentaVisionCoordinator], Camera):
 
     async def stream_source(self) -> str | None:
         """Return the stream source URL."""
-        return self._api.get_hls_url(self._camera_id)
-
-    @property
-    def frontend_stream_type(self) -> str:
-        """Return the stream type for the frontend."""
-        return "hls"
+        token = self._api.session_token
+        if self._hls_url is None or token != self._hls_token:
+            self._hls_token = token
+            self._hls_url = self._api.get_hls_url(self._camera_id)
+        return self._hls_url
 
     async def async_turn_on(self) -> None:
         """Turn on the camera (start streaming)."""
@@ -1,11 +1,10 @@
 """Config flow for PentaVision integration."""
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -13,10 +12,14 @@ from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CONF_API_KEY, DEFAULT_PORT, DOMAIN
+from .api import PentaVisionAPI, PentaVisionAPIError
+from .const import CONF_API_KEY, DEFAULT_PORT, DOMAIN, ERROR_INVALID_RESPONSE
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds allowed for the whole credential check, handshake and revoke
+VALIDATION_TIMEOUT = 10
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -43,40 +46,32 @@ class PentaVisionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             api_key = user_input[CONF_API_KEY]
 
             # Test connection
+            api = PentaVisionAPI(host, port, api_key, async_get_clientsession(self.hass))
             try:
-                session = async_get_clientsession(self.hass)
-                url = f"http://{host}:{port}/api/auth/handshake/init"
-
-                async with session.post(
-                    url,
-                    json={"api_key_hash": hashlib.sha256(api_key.encode()).hexdigest()},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if "challenge" in data:
-                            # Connection successful
-                            await self.async_set_unique_id(f"{host}:{port}")
-                            self._abort_if_unique_id_configured()
-
-                            return self.async_create_entry(
-                                title=f"PentaVision ({host})",
-                                data=user_input,
-                            )
-                        else:
-                            errors["base"] = "invalid_response"
-                    elif response.status == 403:
-                        errors["base"] = "invalid_api_key"
-                    else:
-                        errors["base"] = "cannot_connect"
-
-            except aiohttp.ClientConnectorError:
-                errors["base"] = "cannot_connect"
-            except aiohttp.ClientError:
+                async with asyncio.timeout(VALIDATION_TIMEOUT):
+                    await api.handshake()
+                    # Connection successful, the test session is no longer needed
+                    await api.revoke_session()
+            except TimeoutError:
                 errors["base"] = "cannot_connect"
+            except PentaVisionAPIError as err:
+                if err.status in (401, 403):
+                    errors["base"] = "invalid_api_key"
+                elif err.code == ERROR_INVALID_RESPONSE:
+                    errors["base"] = "invalid_response"
+                else:
+                    errors["base"] = "cannot_connect"
             except Exception:
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
+            else:
+                await self.async_set_unique_id(f"{host}:{port}")
+                self._abort_if_unique_id_configured()
+
+                return self.async_create_entry(
+                    title=f"PentaVision ({host})",
+                    data=user_input,
+                )
 
         return self.async_show_form(
             step_id="user",
@@ -11,6 +11,11 @@ CONF_API_KEY = "api_key"
 DEFAULT_PORT = 8473
 DEFAULT_NAME = "PentaVision"
 
+# Connection
+CONNECTION_LIMIT = 64
+CONNECTION_LIMIT_PER_HOST = 16
+KEEPALIVE_TIMEOUT = 75
+
 # API Endpoints
 API_HANDSHAKE_INIT = "/api/auth/handshake/init"
 API_HANDSHAKE_COMPLETE = "/api/auth/handshake/complete"
@@ -22,9 +27,14 @@ API_CAMERA_STREAM = "/api/cameras/{camera_id}/stream"
 API_MJPEG_STREAM = "/stream/mjpeg/{camera_id}"
 API_HLS_PLAYLIST = "/stream/hls/{camera_id}/index.m3u8"
 API_STATUS = "/api/status"
+API_BULK = "/api/bulk"
 API_EVENTS = "/api/events"
 API_PTZ = "/api/cameras/{camera_id}/ptz"
 
+# Error codes
+ERROR_INVALID_RESPONSE = "INVALID_RESPONSE"
+ERROR_SESSION_INVALID = "SESSION_INVALID"
+
 # Attributes
 ATTR_CAMERA_ID = "camera_id"
 ATTR_CAMERA_NAME = "camera_name"
@@ -34,12 +44,31 @@ ATTR_SNAPSHOT_URL = "snapshot_url"
 ATTR_PTZ_CAPABLE = "ptz_capable"
 ATTR_RECORDING = "recording"
 ATTR_MOTION_DETECTED = "motion_detected"
+ATTR_COMMANDS = "commands"
+ATTR_DIRECTION = "direction"
+ATTR_SPEED = "speed"
 
 # Services
 SERVICE_PTZ_MOVE = "ptz_move"
+SERVICE_PTZ_MOVE_BATCH = "ptz_move_batch"
 SERVICE_PTZ_PRESET = "ptz_preset"
 SERVICE_SNAPSHOT = "take_snapshot"
 
+# PTZ
+PTZ_DIRECTIONS = [
+    "up",
+    "down",
+    "left",
+    "right",
+    "up_left",
+    "up_right",
+    "down_left",
+    "down_right",
+    "zoom_in",
+    "zoom_out",
+]
+DEFAULT_PTZ_SPEED = 50
+
 # Events
 EVENT_MOTION_DETECTED = f"{DOMAIN}_motion_detected"
 EVENT_CAMERA_OFFLINE = f"{DOMAIN}_camera_offline"
@@ -5,7 +5,9 @@ import logging
 from datetime import timedelta
 from typing import Any
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import PentaVisionAPI, PentaVisionAPIError
@@ -16,44 +18,112 @@ _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=30)
 
 
-class PentaVisionCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator to manage fetching PentaVision data."""
+class PentaVisionStateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Coordinator to manage fetching PentaVision server and camera state."""
 
-    def __init__(self, hass: HomeAssistant, api: PentaVisionAPI) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: PentaVisionAPI,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            always_update=False,
         )
+        self.entry = entry
         self.api = api
-        self.cameras: list[dict[str, Any]] = []
+        self.cameras_by_id: dict[str, dict[str, Any]] = {}
+        # Per-camera entity metadata, built on first lookup during setup.
+        # A change in the camera IDs reloads the entry, so it is never rebuilt
+        self._unique_ids: dict[str, dict[str, str]] = {}
+        self._entity_names: dict[str, dict[str, str]] = {}
+        self._device_info: dict[str, DeviceInfo] = {}
+
+        # Device info shared by all entities of the server device
+        self.server_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="PentaVision Server",
+            manufacturer="PentaVision",
+            model="Video Tunnel Server",
+        )
+
+    @property
+    def cameras(self) -> list[dict[str, Any]]:
+        """Return the cameras from the latest poll."""
+        if self.data is None:
+            return []
+        return self.data["cameras"]
+
+    def unique_ids_for(self, camera_id: str) -> dict[str, str]:
+        """Return a camera's entity unique IDs, keyed by entity kind."""
+        unique_ids = self._unique_ids.get(camera_id)
+        if unique_ids is None:
+            base_id = f"{self.entry.entry_id}_{camera_id}"
+            unique_ids = self._unique_ids[camera_id] = {
+                "camera": base_id,
+                "motion": f"{base_id}_motion",
+                "online": f"{base_id}_online",
+            }
+        return unique_ids
+
+    def entity_names_for(self, camera_id: str) -> dict[str, str]:
+        """Return a camera's entity names, keyed by entity kind."""
+        entity_names = self._entity_names.get(camera_id)
+        if entity_names is None:
+            camera = self.cameras_by_id.get(camera_id, {})
+            name = camera.get("name", f"Camera {camera_id}")
+            entity_names = self._entity_names[camera_id] = {
+                "camera": name,
+                "motion": f"{name} Motion",
+                "online": f"{name} Online",
+            }
+        return entity_names
+
+    def device_info_for(self, camera_id: str) -> DeviceInfo:
+        """Return the device info shared by all entities of a camera."""
+        device_info = self._device_info.get(camera_id)
+        if device_info is None:
+            camera = self.cameras_by_id.get(camera_id, {})
+            device_info = self._device_info[camera_id] = DeviceInfo(
+                identifiers={(DOMAIN, self.unique_ids_for(camera_id)["camera"])},
+                name=self.entity_names_for(camera_id)["camera"],
+                manufacturer="PentaVision",
+                model=camera.get("model", "IP Camera"),
+                sw_version=camera.get("firmware", "Unknown"),
+                via_device=(DOMAIN, self.entry.entry_id),
+            )
+        return device_info
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from PentaVision API."""
-        try:
-            # Get server status
-            status = await self.api.get_status()
+        """Fetch data from PentaVision API.
 
-            # Get cameras list
-            self.cameras = await self.api.get_cameras()
+        With always_update disabled, listeners are skipped only when a poll
+        returns data equal to the previous one. The server status includes
+        counters such as uptime and requests_total that change on every
+        poll, so this coordinator still notifies its listeners each time;
+        the entities then skip writes for their own unchanged state.
+        """
+        try:
+            # Get server status and current camera state
+            payload = await self.api.get_bulk()
+            cameras = payload["cameras"]
+            self.cameras_by_id = {
+                camera.get("id") or camera.get("camera_id"): camera
+                for camera in cameras
+            }
 
             return {
-                "status": status,
-                "cameras": self.cameras,
-                "camera_count": len(self.cameras),
-                "server_online": True,
+                "status": payload["status"],
+                "cameras": cameras,
+                "camera_count": len(cameras),
             }
 
         except PentaVisionAPIError as err:
-            # Try to re-authenticate if session expired
-            if err.code == "SESSION_INVALID":
-                _LOGGER.info("Session expired, re-authenticating...")
-                if await self.api.authenticate():
-                    # Retry the request
-                    return await self._async_update_data()
-
             raise UpdateFailed(f"Error communicating with PentaVision: {err}") from err
 
         except Exception as err:
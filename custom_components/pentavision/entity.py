@@ -0,0 +1,40 @@
+"""Base entity for PentaVision integration."""
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import PentaVisionStateCoordinator
+
+
+class PentaVisionStateEntity(CoordinatorEntity[PentaVisionStateCoordinator]):
+    """Coordinator entity that writes its state only when it changed.
+
+    Subclasses return the values that make up their written state from
+    _written_state.
+    """
+
+    # Home Assistant's base classes keep a __dict__ for their _attr_* values,
+    # so only the attributes added here are slotted
+    __slots__ = ("_last_written",)
+
+    def __init__(self, coordinator: PentaVisionStateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._last_written: tuple[Any, ...] | None = None
+
+    @abstractmethod
+    def _written_state(self) -> tuple[Any, ...]:
+        """Return the values compared to decide whether to write state."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the entity's state changed."""
+        current = self._written_state()
+        if current == self._last_written:
+            return
+        self._last_written = current
+        super()._handle_coordinator_update()
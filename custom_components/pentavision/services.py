@@ -0,0 +1,98 @@
+"""Services for PentaVision integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+from .api import PentaVisionAPIError
+from .const import (
+    ATTR_COMMANDS,
+    ATTR_DIRECTION,
+    ATTR_SPEED,
+    DEFAULT_PTZ_SPEED,
+    DOMAIN,
+    PTZ_DIRECTIONS,
+    SERVICE_PTZ_MOVE_BATCH,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PTZ_MOVE_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_COMMANDS): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                        vol.Required(ATTR_DIRECTION): vol.In(PTZ_DIRECTIONS),
+                        vol.Optional(ATTR_SPEED, default=DEFAULT_PTZ_SPEED): vol.All(
+                            vol.Coerce(int), vol.Range(min=1, max=100)
+                        ),
+                    }
+                )
+            ],
+        ),
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register PentaVision services."""
+    if hass.services.has_service(DOMAIN, SERVICE_PTZ_MOVE_BATCH):
+        return
+
+    async def async_ptz_move_batch(call: ServiceCall) -> None:
+        """Move several cameras at once, grouped per server."""
+        registry = er.async_get(hass)
+        targets: dict[str, list[tuple[str, str, int]]] = {}
+
+        for command in call.data[ATTR_COMMANDS]:
+            entity_id = command[ATTR_ENTITY_ID]
+            entity = registry.async_get(entity_id)
+            if (
+                entity is None
+                or entity.platform != DOMAIN
+                or entity.domain != Platform.CAMERA
+                or entity.config_entry_id not in hass.data[DOMAIN]
+            ):
+                raise HomeAssistantError(f"{entity_id} is not a PentaVision camera")
+
+            # Camera unique IDs are "<entry_id>_<camera_id>"
+            camera_id = entity.unique_id.removeprefix(f"{entity.config_entry_id}_")
+            targets.setdefault(entity.config_entry_id, []).append(
+                (camera_id, command[ATTR_DIRECTION], command[ATTR_SPEED])
+            )
+
+        try:
+            await asyncio.gather(
+                *(
+                    hass.data[DOMAIN][entry_id]["api"].ptz_move_many(commands)
+                    for entry_id, commands in targets.items()
+                )
+            )
+        except PentaVisionAPIError as err:
+            raise HomeAssistantError(str(err)) from err
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PTZ_MOVE_BATCH,
+        async_ptz_move_batch,
+        schema=PTZ_MOVE_BATCH_SCHEMA,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove PentaVision services once no entries are loaded."""
+    if hass.data.get(DOMAIN):
+        return
+
+    hass.services.async_remove(DOMAIN, SERVICE_PTZ_MOVE_BATCH)